@@ -10,28 +10,92 @@ import sys
 import json
 import os
 
+try:
+    # Optional: faster parsing straight from bytes
+    import orjson
+except ImportError:
+    orjson = None
+
 SOCKET_PATH = os.environ.get("JNICKG_DICTATE_SOCKET", "/tmp/jnickg-dictate.sock")
+# A leading '@' names a Linux abstract-namespace socket (no file on disk)
+ABSTRACT_SOCKET = SOCKET_PATH.startswith("@")
+SOCKET_ADDRESS = "\0" + SOCKET_PATH[1:] if ABSTRACT_SOCKET else SOCKET_PATH
 
 
-def send_command(cmd: str) -> dict:
-    """Send a command to the daemon and return the response."""
-    if not os.path.exists(SOCKET_PATH):
-        return {"status": "error", "message": "Daemon not running (socket not found)"}
+def daemon_missing() -> bool:
+    """Check for a missing socket file (abstract sockets have none)."""
+    return not ABSTRACT_SOCKET and not os.path.exists(SOCKET_PATH)
+
 
+def connect() -> socket.socket:
+    """Open a connection to the daemon."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    client.settimeout(30)  # 30 second timeout for transcription
     try:
-        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        client.settimeout(30)  # 30 second timeout for transcription
-        client.connect(SOCKET_PATH)
-        client.sendall(cmd.encode("utf-8"))
-        response = client.recv(4096).decode("utf-8")
+        client.connect(SOCKET_ADDRESS)
+    except Exception:
         client.close()
-        return json.loads(response)
-    except socket.timeout:
+        raise
+    return client
+
+
+def request(client: socket.socket, cmd: str) -> dict:
+    """Send one command over an open connection and return the response."""
+    client.sendall(cmd.encode("utf-8"), socket.MSG_NOSIGNAL)
+    # SOCK_SEQPACKET drops whatever does not fit the receive buffer, and a
+    # long transcript can be large; peek with MSG_TRUNC to learn the full
+    # message length, then read exactly that much
+    size = client.recv_into(bytearray(1), 1, socket.MSG_PEEK | socket.MSG_TRUNC)
+    response = client.recv(size)
+    if not response:
+        raise ConnectionError("Daemon closed the connection")
+    if orjson is not None:
+        return orjson.loads(response)
+    return json.loads(response)
+
+
+def error_response(e: Exception) -> dict:
+    """Turn a connection failure into an error response."""
+    if isinstance(e, socket.timeout):
         return {"status": "error", "message": "Timeout waiting for response"}
-    except ConnectionRefusedError:
+    if isinstance(e, ConnectionRefusedError):
         return {"status": "error", "message": "Connection refused - is the daemon running?"}
+    return {"status": "error", "message": str(e)}
+
+
+def send_command(cmd: str) -> dict:
+    """Send a command to the daemon and return the response."""
+    if daemon_missing():
+        return {"status": "error", "message": "Daemon not running (socket not found)"}
+
+    try:
+        with connect() as client:
+            return request(client, cmd)
+    except Exception as e:
+        return error_response(e)
+
+
+def serve() -> int:
+    """Send commands read from stdin, one per line, over a single connection.
+
+    Each response is printed as one line of JSON. Saves a connect per
+    command for scripts and status pollers. Returns the exit status.
+    """
+    if daemon_missing():
+        print(json.dumps({"status": "error", "message": "Daemon not running (socket not found)"}))
+        return 1
+
+    try:
+        with connect() as client:
+            for line in sys.stdin:
+                cmd = line.strip()
+                if cmd:
+                    print(json.dumps(request(client, cmd)), flush=True)
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        print(json.dumps(error_response(e)), flush=True)
+        return 1
+
+    return 0
 
 
 def main():
@@ -40,6 +104,9 @@ def main():
     else:
         cmd = sys.argv[1]
 
+    if cmd == "serve":
+        sys.exit(serve())
+
     result = send_command(cmd)
 
     if result.get("status") == "ok":
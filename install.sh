@@ -86,10 +86,6 @@ if ! command -v arecord &> /dev/null; then
     MISSING_PKGS="$MISSING_PKGS alsa-utils"
 fi
 
-if ! command -v nc &> /dev/null; then
-    MISSING_PKGS="$MISSING_PKGS openbsd-netcat"
-fi
-
 if [ "$INPUT_METHOD" = "ydotool" ] && ! command -v ydotool &> /dev/null; then
     MISSING_PKGS="$MISSING_PKGS ydotool"
 fi
@@ -271,4 +267,4 @@ echo "  systemctl --user status whisper-streaming-server.service"
 echo "  systemctl --user status whisper-dictate.service"
 echo
 echo "Test streaming server:"
-echo "  nc -z localhost $STREAMING_PORT && echo 'Server OK'"
+echo "  echo status | dictate.py serve   # look for \"server_available\": true"
@@ -63,7 +63,7 @@ echo
 
 # Note about system packages and cache
 echo
-echo "Note: System packages (alsa-utils, openbsd-netcat, ydotool/wtype/xdotool)"
+echo "Note: System packages (alsa-utils, ydotool/wtype/xdotool)"
 echo "were not removed. Remove them manually if no longer needed."
 echo
 echo "Whisper model cache (~/.cache/whisper) was not removed."
@@ -7,29 +7,61 @@ by connecting to a SimulStreaming server. Text appears as you speak instead
 of after recording stops.
 """
 
+import asyncio
+import errno
+import shutil
 import subprocess
 import os
 import signal
 import socket
+import struct
 import sys
 import threading
 import json
 import time
 from pathlib import Path
 
+try:
+    # Optional: faster serialization straight to bytes
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 SOCKET_PATH = os.environ.get("JNICKG_DICTATE_SOCKET", "/tmp/jnickg-dictate.sock")
 TEXT_INPUT_METHOD = os.environ.get("JNICKG_DICTATE_INPUT_METHOD", "ydotool")
 STREAMING_HOST = os.environ.get("JNICKG_DICTATE_STREAMING_HOST", "localhost")
 STREAMING_PORT = os.environ.get("JNICKG_DICTATE_STREAMING_PORT", "43001")
 
+# A leading '@' selects a Linux abstract-namespace socket: no file on disk,
+# so no stale socket cleanup or chmod, with access checked via SO_PEERCRED
+ABSTRACT_SOCKET = SOCKET_PATH.startswith("@")
+SOCKET_ADDRESS = "\0" + SOCKET_PATH[1:] if ABSTRACT_SOCKET else SOCKET_PATH
+
+# Maximum number of key presses passed to a single input tool invocation
+MAX_KEYS_PER_CALL = 256
+
+# How long a streaming server availability check stays valid (seconds)
+SERVER_CHECK_TTL = 2.0
+
+# Opened once and handed to every child whose output is discarded, instead
+# of subprocess.DEVNULL reopening /dev/null per spawn
+DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+
 # Global state
 arecord_proc = None
-nc_proc = None
-reader_thread = None
-streaming_lock = threading.Lock()
-typed_so_far = ""
-stop_reader = threading.Event()
+stream_sock = None
+reader_task = None
+streaming_lock = asyncio.Lock()
+typed_so_far: list[str] = []
+typer_proc = None
+typer_failed = False
+typer_lock = threading.Lock()
+client_tasks = set()
+# Resolved absolute paths of input tools, by name
+tool_paths = {}
+# [checked_at, available] from the last streaming server check
+server_check_cache = [float("-inf"), False]
 
 
 def log(msg: str):
@@ -37,6 +69,88 @@ def log(msg: str):
     print(msg, file=sys.stderr, flush=True)
 
 
+def spawn_tool(args: list[str], **kwargs) -> subprocess.Popen:
+    """Start an input tool in a way that lets subprocess use posix_spawn.
+
+    subprocess only takes the posix_spawn path (no page-table copy of the
+    daemon) for an absolute executable path with close_fds=False. The
+    daemon's own FDs are non-inheritable, so nothing leaks to the child.
+    """
+    path = tool_paths.get(args[0])
+    if path is None:
+        path = shutil.which(args[0])
+        if path is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), args[0])
+        tool_paths[args[0]] = path
+
+    return subprocess.Popen([path] + args[1:], close_fds=False, **kwargs)
+
+
+def run_tool(args: list[str]):
+    """Run an input tool to completion, raising CalledProcessError on failure."""
+    proc = spawn_tool(args)
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
+
+
+def write_to_typer(text: str) -> bool:
+    """Type text through a long-lived `ydotool type --file -` process.
+
+    Returns False if the typer could not be used, so the caller can fall
+    back to a one-shot invocation. A typer that exits with an error only
+    shows up on the next segment (the write before it lands in the pipe
+    buffer), and the persistent typer stays off until close_typer().
+    """
+    global typer_proc, typer_failed
+
+    with typer_lock:
+        if typer_failed:
+            return False
+
+        try:
+            if typer_proc is not None and typer_proc.poll() is not None:
+                if typer_proc.returncode != 0:
+                    log(f"Typer process exited with status {typer_proc.returncode}, "
+                        "falling back to one-shot ydotool")
+                    typer_proc = None
+                    typer_failed = True
+                    return False
+                typer_proc = None
+
+            if typer_proc is None:
+                typer_proc = spawn_tool(["ydotool", "type", "--file", "-"], stdin=subprocess.PIPE)
+            typer_proc.stdin.write(text.encode("utf-8"))
+            typer_proc.stdin.flush()
+            return True
+        except BrokenPipeError:
+            log("Typer process closed its input, falling back to one-shot ydotool")
+            typer_proc = None
+            typer_failed = True
+            return False
+
+
+def close_typer():
+    """Close the long-lived typer, letting it finish any pending text."""
+    global typer_proc, typer_failed
+
+    with typer_lock:
+        typer_failed = False
+
+        if typer_proc is None:
+            return
+
+        try:
+            typer_proc.stdin.close()
+            typer_proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            typer_proc.kill()
+            typer_proc.wait()
+
+        if typer_proc.returncode != 0:
+            log(f"Typer process exited with status {typer_proc.returncode}")
+        typer_proc = None
+
+
 def type_text(text: str):
     """Type text into the focused window using the configured method."""
     if not text:
@@ -44,11 +158,13 @@ def type_text(text: str):
 
     try:
         if TEXT_INPUT_METHOD == "wtype":
-            subprocess.run(["wtype", "--", text], check=True)
+            run_tool(["wtype", "--", text])
         elif TEXT_INPUT_METHOD == "ydotool":
-            subprocess.run(["ydotool", "type", "--", text], check=True)
+            # Keep one ydotool process per session instead of one per segment
+            if not write_to_typer(text):
+                run_tool(["ydotool", "type", "--", text])
         elif TEXT_INPUT_METHOD == "xdotool":
-            subprocess.run(["xdotool", "type", "--clearmodifiers", "--", text], check=True)
+            run_tool(["xdotool", "type", "--clearmodifiers", "--", text])
         else:
             log(f"Unknown input method: {TEXT_INPUT_METHOD}")
     except subprocess.CalledProcessError as e:
@@ -62,47 +178,49 @@ def send_backspaces(count: int):
     if count <= 0:
         return
 
+    if TEXT_INPUT_METHOD == "wtype":
+        # wtype uses key names
+        key_args = ["-k", "BackSpace"]
+        base_args = ["wtype"]
+    elif TEXT_INPUT_METHOD == "ydotool":
+        # ydotool: key code 14 is backspace, :1 press :0 release
+        key_args = ["14:1", "14:0"]
+        base_args = ["ydotool", "key"]
+    elif TEXT_INPUT_METHOD == "xdotool":
+        key_args = ["BackSpace"]
+        base_args = ["xdotool", "key"]
+    else:
+        log(f"Unknown input method for backspace: {TEXT_INPUT_METHOD}")
+        return
+
     try:
-        if TEXT_INPUT_METHOD == "wtype":
-            # wtype uses key names
-            for _ in range(count):
-                subprocess.run(["wtype", "-k", "BackSpace"], check=True)
-        elif TEXT_INPUT_METHOD == "ydotool":
-            # ydotool: key code 14 is backspace, :1 press :0 release
-            for _ in range(count):
-                subprocess.run(["ydotool", "key", "14:1", "14:0"], check=True)
-        elif TEXT_INPUT_METHOD == "xdotool":
-            for _ in range(count):
-                subprocess.run(["xdotool", "key", "BackSpace"], check=True)
-        else:
-            log(f"Unknown input method for backspace: {TEXT_INPUT_METHOD}")
+        # All tools accept many keys per call; batch them to avoid a
+        # process per character, chunked to keep argv bounded
+        while count > 0:
+            batch = min(count, MAX_KEYS_PER_CALL)
+            run_tool(base_args + key_args * batch)
+            count -= batch
     except subprocess.CalledProcessError as e:
         log(f"Failed to send backspaces: {e}")
     except FileNotFoundError:
         log(f"Text input tool not found: {TEXT_INPUT_METHOD}")
 
 
-def parse_streaming_line(line: str) -> str:
-    """Parse '<start_ms> <end_ms>  <text>' format, return text (preserving leading space)."""
-    parts = line.strip().split(' ', maxsplit=2)
-    if len(parts) >= 3:
-        return parts[2]
-    return ""
-
-
-def find_common_prefix_length(s1: str, s2: str) -> int:
-    """Find the length of the longest common prefix between two strings."""
-    min_len = min(len(s1), len(s2))
-    for i in range(min_len):
-        if s1[i] != s2[i]:
-            return i
-    return min_len
+def parse_streaming_line(line: bytes) -> str:
+    """Parse b'<start_ms> <end_ms>  <text>' format, return text (preserving leading space)."""
+    # Slice past the two timestamps instead of splitting, and only decode
+    # the text field
+    i = line.find(b" ")
+    if i < 0:
+        return ""
+    j = line.find(b" ", i + 1)
+    if j < 0:
+        return ""
+    return line[j + 1:].rstrip().decode("utf-8", errors="replace")
 
 
 def handle_streaming_output(new_text: str):
     """Handle streaming output by typing each segment directly."""
-    global typed_so_far
-
     if not new_text:
         return
 
@@ -111,61 +229,96 @@ def handle_streaming_output(new_text: str):
     type_text(new_text)
 
     # Accumulate for final result
-    typed_so_far += new_text
+    typed_so_far.append(new_text)
 
 
-def reader_thread_func():
-    """Thread function to read streaming output from nc and type incrementally."""
-    global nc_proc, typed_so_far
+async def read_streaming_output(sock: socket.socket):
+    """Read streaming output from the server and type incrementally."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    fd = sock.fileno()
 
-    log("Reader thread started")
+    # arecord shares this socket and needs it blocking, so it cannot be
+    # handed to an asyncio transport; feed a StreamReader from readiness
+    # callbacks on the event loop instead.
+    def on_readable():
+        try:
+            data = sock.recv(65536)
+        except OSError as e:
+            log(f"Reader error: {e}")
+            data = b""
+        if data:
+            reader.feed_data(data)
+        else:
+            loop.remove_reader(fd)
+            reader.feed_eof()
 
-    while not stop_reader.is_set():
-        if nc_proc is None or nc_proc.stdout is None:
-            break
+    loop.add_reader(fd, on_readable)
+    log("Reader started")
 
-        try:
-            line = nc_proc.stdout.readline()
-            if not line:
-                # EOF - connection closed
-                log("Reader: EOF from nc")
-                break
+    try:
+        async for line in reader:
+            text = parse_streaming_line(line)
+            if text:
+                # Typing may spawn a process; keep it off the event loop
+                await asyncio.to_thread(handle_streaming_output, text)
 
-            line = line.decode("utf-8", errors="replace").strip()
-            if line:
-                log(f"Received: {line}")
-                text = parse_streaming_line(line)
-                if text:
-                    handle_streaming_output(text)
+        log("Reader: EOF from server")
+    except Exception as e:
+        log(f"Reader error: {e}")
+    finally:
+        loop.remove_reader(fd)
+        log("Reader exiting")
 
-        except Exception as e:
-            log(f"Reader error: {e}")
-            break
 
-    log("Reader thread exiting")
+async def check_streaming_server(cached: bool = True) -> bool:
+    """Check if the streaming server is running and accepting connections.
 
+    Status pollers call this often, so a result younger than
+    SERVER_CHECK_TTL seconds is reused unless cached is False.
+    """
+    now = time.monotonic()
+    if cached and now - server_check_cache[0] < SERVER_CHECK_TTL:
+        return server_check_cache[1]
 
-def check_streaming_server() -> bool:
-    """Check if the streaming server is running and accepting connections."""
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            s.connect((STREAMING_HOST, int(STREAMING_PORT)))
-            return True
-    except (socket.error, socket.timeout, ValueError):
-        return False
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(STREAMING_HOST, int(STREAMING_PORT)), timeout=1
+        )
+        writer.close()
+        available = True
+    except (OSError, asyncio.TimeoutError, ValueError):
+        available = False
 
+    server_check_cache[:] = [now, available]
+    return available
+
+
+def close_stream_sock():
+    """Shut down and close the streaming server connection, if any."""
+    global stream_sock
+
+    if stream_sock is None:
+        return
+
+    try:
+        stream_sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    stream_sock.close()
+    stream_sock = None
 
-def start_streaming() -> dict:
+
+async def start_streaming() -> dict:
     """Start streaming dictation."""
-    global arecord_proc, nc_proc, reader_thread, typed_so_far, stop_reader
+    global arecord_proc, stream_sock, reader_task
 
-    with streaming_lock:
+    async with streaming_lock:
         if arecord_proc is not None:
             return {"status": "error", "message": "Already streaming"}
 
         # Check if streaming server is available
-        if not check_streaming_server():
+        if not await check_streaming_server(cached=False):
             return {
                 "status": "error",
                 "message": f"Streaming server not available at {STREAMING_HOST}:{STREAMING_PORT}. "
@@ -174,88 +327,86 @@ def start_streaming() -> dict:
 
         try:
             # Reset state
-            typed_so_far = ""
-            stop_reader.clear()
+            typed_so_far.clear()
 
-            # Start arecord piping to nc
-            # arecord: -f S16_LE (16-bit signed little-endian), -c1 (mono), -r 16000 (16kHz), -t raw (raw PCM)
-            arecord_proc = subprocess.Popen(
-                ["arecord", "-f", "S16_LE", "-c1", "-r", "16000", "-t", "raw", "-D", "default"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL
+            # Connect to the server ourselves; small audio writes must not
+            # wait on Nagle's algorithm
+            stream_sock = await asyncio.to_thread(
+                socket.create_connection, (STREAMING_HOST, int(STREAMING_PORT)), 1
             )
+            stream_sock.settimeout(None)
+            stream_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
-            nc_proc = subprocess.Popen(
-                ["nc", STREAMING_HOST, STREAMING_PORT],
-                stdin=arecord_proc.stdout,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL
+            # arecord writes straight into the socket, no nc or pipe in between
+            # arecord: -f S16_LE (16-bit signed little-endian), -c1 (mono), -r 16000 (16kHz), -t raw (raw PCM)
+            arecord_proc = await asyncio.create_subprocess_exec(
+                "arecord", "-f", "S16_LE", "-c1", "-r", "16000", "-t", "raw", "-D", "default",
+                stdout=stream_sock.fileno(),
+                stderr=DEVNULL_FD
             )
 
-            # Allow SIGPIPE propagation
-            arecord_proc.stdout.close()
-
-            # Start reader thread
-            reader_thread = threading.Thread(target=reader_thread_func, daemon=True)
-            reader_thread.start()
+            reader_task = asyncio.create_task(read_streaming_output(stream_sock))
 
             log(f"Streaming started to {STREAMING_HOST}:{STREAMING_PORT}")
             return {"status": "ok", "message": "Streaming started"}
 
         except FileNotFoundError as e:
             arecord_proc = None
-            nc_proc = None
+            close_stream_sock()
             return {"status": "error", "message": f"Required tool not found: {e.filename}"}
         except Exception as e:
             arecord_proc = None
-            nc_proc = None
+            close_stream_sock()
             return {"status": "error", "message": str(e)}
 
 
-def stop_streaming() -> dict:
+async def stop_streaming() -> dict:
     """Stop streaming and return the final transcription."""
-    global arecord_proc, nc_proc, reader_thread, typed_so_far, stop_reader
+    global arecord_proc, reader_task
 
-    with streaming_lock:
+    async with streaming_lock:
         if arecord_proc is None:
             return {"status": "error", "message": "Not streaming"}
 
-        final_text = typed_so_far
+        final_text = "".join(typed_so_far)
 
         try:
-            # Signal reader thread to stop
-            stop_reader.set()
-
             # Stop arecord gracefully
-            if arecord_proc and arecord_proc.poll() is None:
+            if arecord_proc.returncode is None:
                 arecord_proc.terminate()
                 try:
-                    arecord_proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(arecord_proc.wait(), timeout=2)
+                except asyncio.TimeoutError:
                     arecord_proc.kill()
 
-            # Wait for nc to close (server sends final segment on disconnect)
-            if nc_proc and nc_proc.poll() is None:
-                try:
-                    nc_proc.wait(timeout=3)
-                except subprocess.TimeoutExpired:
-                    nc_proc.terminate()
-
-            # Wait for reader thread to finish
-            if reader_thread and reader_thread.is_alive():
-                reader_thread.join(timeout=2)
+            # Half-close so the server sees the end of the audio right away,
+            # flushes its final segment and closes; the reader drains up to
+            # that EOF, so this only waits as long as the server needs
+            try:
+                stream_sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+            await asyncio.wait({reader_task}, timeout=3)
+            reader_task.cancel()
+            try:
+                await reader_task
+            except asyncio.CancelledError:
+                pass
+
+            close_stream_sock()
+            await asyncio.to_thread(close_typer)
 
             log("Streaming stopped")
 
             # Get the final text that was typed
-            final_text = typed_so_far
+            final_text = "".join(typed_so_far)
 
         except Exception as e:
             log(f"Error stopping streaming: {e}")
         finally:
             arecord_proc = None
-            nc_proc = None
-            reader_thread = None
+            close_stream_sock()
+            reader_task = None
 
         if final_text:
             return {"status": "ok", "message": "Stopped", "text": final_text}
@@ -263,23 +414,19 @@ def stop_streaming() -> dict:
             return {"status": "ok", "message": "Stopped (no speech detected)", "text": ""}
 
 
-def toggle_streaming() -> dict:
+async def toggle_streaming() -> dict:
     """Toggle streaming state."""
-    with streaming_lock:
-        is_streaming = arecord_proc is not None
-
-    if is_streaming:
-        return stop_streaming()
+    if arecord_proc is not None:
+        return await stop_streaming()
     else:
-        return start_streaming()
+        return await start_streaming()
 
 
-def get_status() -> dict:
+async def get_status() -> dict:
     """Get current daemon status."""
-    with streaming_lock:
-        is_streaming = arecord_proc is not None
+    is_streaming = arecord_proc is not None
 
-    server_available = check_streaming_server()
+    server_available = await check_streaming_server()
 
     return {
         "status": "ok",
@@ -288,104 +435,177 @@ def get_status() -> dict:
         "streaming_host": STREAMING_HOST,
         "streaming_port": STREAMING_PORT,
         "input_method": TEXT_INPUT_METHOD,
-        "typed_so_far": typed_so_far if is_streaming else ""
+        "typed_so_far": "".join(typed_so_far) if is_streaming else ""
     }
 
 
-def handle_command(cmd: str) -> dict:
+async def ping() -> dict:
+    """Answer a liveness check."""
+    return {"status": "ok", "message": "pong"}
+
+
+# Client command name -> handler
+COMMANDS = {
+    "start": start_streaming,
+    "stop": stop_streaming,
+    "toggle": toggle_streaming,
+    "status": get_status,
+    "ping": ping,
+}
+
+
+async def handle_command(cmd: str) -> dict:
     """Handle a command from the client."""
     cmd = cmd.strip().lower()
 
-    if cmd == "start":
-        return start_streaming()
-    elif cmd == "stop":
-        return stop_streaming()
-    elif cmd == "toggle":
-        return toggle_streaming()
-    elif cmd == "status":
-        return get_status()
-    elif cmd == "ping":
-        return {"status": "ok", "message": "pong"}
-    else:
+    handler = COMMANDS.get(cmd)
+    if handler is None:
         return {"status": "error", "message": f"Unknown command: {cmd}"}
+    return await handler()
 
 
-def handle_client(conn: socket.socket):
-    """Handle a client connection."""
+def encode_response(result: dict) -> bytes:
+    """Serialize a response for the client, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(result).encode("utf-8")
+
+
+def peer_is_same_user(conn: socket.socket) -> bool:
+    """Check that the process on the other end of conn runs as our uid."""
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+async def handle_client(conn: socket.socket):
+    """Handle a client connection until the client closes it."""
+    loop = asyncio.get_running_loop()
+
     try:
-        data = conn.recv(1024).decode("utf-8")
-        if data:
-            result = handle_command(data)
-            conn.sendall(json.dumps(result).encode("utf-8"))
+        # Abstract sockets have no file permissions to rely on
+        if ABSTRACT_SOCKET and not peer_is_same_user(conn):
+            log("Rejected client owned by another user")
+            return
+
+        # A client may send several commands on one connection; each
+        # SEQPACKET message is one command
+        while True:
+            data = (await loop.sock_recv(conn, 1024)).decode("utf-8")
+            if not data:
+                break
+            result = await handle_command(data)
+            await loop.sock_sendall(conn, encode_response(result))
     except Exception as e:
         log(f"Client error: {e}")
     finally:
         conn.close()
 
 
-def cleanup(signum=None, frame=None):
+async def accept_clients(server: socket.socket, shutdown: asyncio.Event):
+    """Accept client connections and handle each in its own task."""
+    loop = asyncio.get_running_loop()
+
+    try:
+        while True:
+            conn, _ = await loop.sock_accept(server)
+            task = asyncio.create_task(handle_client(conn))
+            client_tasks.add(task)
+            task.add_done_callback(client_tasks.discard)
+    except Exception as e:
+        log(f"Server error: {e}")
+        shutdown.set()
+
+
+def sd_notify(state: str):
+    """Send a state update to systemd's notify socket, if we have one."""
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return
+
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as s:
+            s.connect(address)
+            s.sendall(state.encode("utf-8"))
+    except OSError as e:
+        log(f"Failed to notify systemd: {e}")
+
+
+def cleanup():
     """Clean up on exit."""
-    global arecord_proc, nc_proc, stop_reader
+    global arecord_proc
 
     log("Shutting down...")
+    sd_notify("STOPPING=1")
 
     # Stop any ongoing streaming
-    stop_reader.set()
+    if reader_task:
+        reader_task.cancel()
 
-    if arecord_proc:
+    if arecord_proc and arecord_proc.returncode is None:
         arecord_proc.terminate()
-        arecord_proc = None
+    arecord_proc = None
 
-    if nc_proc:
-        nc_proc.terminate()
-        nc_proc = None
+    close_stream_sock()
+    close_typer()
 
     # Remove socket file
-    if os.path.exists(SOCKET_PATH):
+    if not ABSTRACT_SOCKET and os.path.exists(SOCKET_PATH):
         os.remove(SOCKET_PATH)
 
-    sys.exit(0)
-
 
-def main():
+async def serve():
     """Main daemon loop."""
-    # Set up signal handlers
-    signal.signal(signal.SIGTERM, cleanup)
-    signal.signal(signal.SIGINT, cleanup)
+    # Server socket, streaming socket and client sockets all share the
+    # event loop's single epoll instance
+    loop = asyncio.get_running_loop()
+    shutdown = asyncio.Event()
+    loop.add_signal_handler(signal.SIGTERM, shutdown.set)
+    loop.add_signal_handler(signal.SIGINT, shutdown.set)
 
     log(f"Whisper Dictation Daemon (Streaming Mode)")
     log(f"Streaming server: {STREAMING_HOST}:{STREAMING_PORT}")
     log(f"Input method: {TEXT_INPUT_METHOD}")
 
-    # Check streaming server availability (warning only, not fatal)
-    if not check_streaming_server():
-        log(f"Warning: Streaming server not available at {STREAMING_HOST}:{STREAMING_PORT}")
-        log("The server may still be starting up. Dictation will fail until it's ready.")
-
     # Remove stale socket
-    if os.path.exists(SOCKET_PATH):
+    if not ABSTRACT_SOCKET and os.path.exists(SOCKET_PATH):
         os.remove(SOCKET_PATH)
 
-    # Create Unix socket
-    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    server.bind(SOCKET_PATH)
-    os.chmod(SOCKET_PATH, 0o600)
-    server.listen(5)
+    # Create Unix socket (SEQPACKET keeps each command/response a single message)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    server.setblocking(False)
+    server.bind(SOCKET_ADDRESS)
+    if not ABSTRACT_SOCKET:
+        os.chmod(SOCKET_PATH, 0o600)
+    server.listen(16)
 
     log(f"Daemon listening on {SOCKET_PATH}")
 
+    # Clients can connect from here on; let systemd (Type=notify) start
+    # units ordered after us
+    accept_task = asyncio.create_task(accept_clients(server, shutdown))
+    sd_notify("READY=1")
+
+    # Check streaming server availability (warning only, not fatal)
+    if not await check_streaming_server():
+        log(f"Warning: Streaming server not available at {STREAMING_HOST}:{STREAMING_PORT}")
+        log("The server may still be starting up. Dictation will fail until it's ready.")
+
     try:
-        while True:
-            conn, _ = server.accept()
-            # Handle each client in a thread to avoid blocking
-            thread = threading.Thread(target=handle_client, args=(conn,))
-            thread.daemon = True
-            thread.start()
-    except Exception as e:
-        log(f"Server error: {e}")
+        await shutdown.wait()
     finally:
+        accept_task.cancel()
+        server.close()
         cleanup()
 
 
+def main():
+    """Run the daemon's event loop."""
+    asyncio.run(serve())
+
+
 if __name__ == "__main__":
     main()